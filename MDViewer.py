@@ -11,6 +11,8 @@ import base64
 from io import BytesIO
 import tempfile
 import re
+import threading
+import tracemalloc
 
 # Suppress the specific warning from mermaid.py
 warnings.filterwarnings("ignore", message="IPython is not installed. Mermaidjs magic function is not available.")
@@ -28,6 +30,9 @@ class App(ttk.Window):
         self.ignore_dirs = ['node_modules', '.git', '.venv', '__pycache__']
         self.open_files = {} # To store {file_path: {"tab_id": str, "tab_frame": ttk.Frame}}
         self.html_cache = {} # To cache rendered HTML
+        self.memory_snapshot = None # Baseline tracemalloc snapshot for diagnostics
+        self.diagnostics_window = None
+        self._started_tracing = False # Only stop tracemalloc if we started it
 
         # Set a larger default font for UI elements
         self.style.configure("Treeview", font=("Segoe UI", 12), rowheight=30)
@@ -72,6 +77,7 @@ class App(ttk.Window):
 
         help_menu = tk.Menu(self.menu, tearoff=False)
         self.menu.add_cascade(label="Help", menu=help_menu)
+        help_menu.add_command(label="Diagnostics", command=self.show_diagnostics)
         help_menu.add_command(label="About", command=self.show_about)
 
         # Main container
@@ -420,6 +426,110 @@ class App(ttk.Window):
         about_win.grab_set()
         self.wait_window(about_win)
 
+    def _count_html_frames(self, widget=None):
+        widget = widget or self
+        count = 0
+        for child in widget.winfo_children():
+            if isinstance(child, HtmlFrame):
+                count += 1
+            count += self._count_html_frames(child)
+        return count
+
+    def get_resource_stats(self):
+        return {
+            "html_frames": self._count_html_frames(),
+            "threads": threading.active_count(),
+            "html_cache": len(self.html_cache),
+            "open_files": len(self.open_files),
+        }
+
+    def take_memory_snapshot(self):
+        # Store a baseline snapshot to diff later snapshots against
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.memory_snapshot = tracemalloc.take_snapshot()
+        return self.memory_snapshot
+
+    def stop_memory_tracing(self):
+        # Tracing slows every allocation, so only keep it on while it is needed.
+        # Leave it alone if it was enabled externally (e.g. python -X tracemalloc).
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+        self.memory_snapshot = None
+
+    def compare_memory_snapshots(self, top_n=10):
+        if self.memory_snapshot is None or not tracemalloc.is_tracing():
+            return None
+        current = tracemalloc.take_snapshot()
+        stats = current.compare_to(self.memory_snapshot, "lineno")
+        return stats[:top_n]
+
+    def show_diagnostics(self):
+        if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+            self.diagnostics_window.deiconify()
+            self.diagnostics_window.lift()
+            self.diagnostics_window.focus_set()
+            return
+
+        diag_win = tk.Toplevel(self)
+        self.diagnostics_window = diag_win
+        diag_win.title("Diagnostics")
+        diag_win.geometry("700x500")
+        diag_win.iconphoto(False, self.photo)
+
+        main_frame = ttk.Frame(diag_win, padding=20)
+        main_frame.pack(expand=True, fill="both")
+
+        stats_label = ttk.Label(main_frame, font=("Segoe UI", 12), justify="left")
+        stats_label.pack(anchor="w", pady=5)
+
+        diff_text = tk.Text(main_frame, wrap="none", height=15, font=("Consolas", 10))
+        diff_text.pack(expand=True, fill="both", pady=5)
+
+        def refresh():
+            stats = self.get_resource_stats()
+            stats_label.config(text=(
+                f"Live HtmlFrames: {stats['html_frames']}\n"
+                f"Threads: {stats['threads']}\n"
+                f"HTML cache entries: {stats['html_cache']}\n"
+                f"Open files: {stats['open_files']}"
+            ))
+            diff_text.delete("1.0", "end")
+            stats_diff = self.compare_memory_snapshots()
+            if stats_diff is None:
+                diff_text.insert("1.0", "No snapshot taken yet. Click 'Take Snapshot' to set a baseline.\n"
+                                        "Memory tracing starts when the snapshot is taken and stops when this window is closed.")
+                return
+            for stat in stats_diff:
+                diff_text.insert("end", f"{stat}\n")
+
+        def snapshot():
+            self.take_memory_snapshot()
+            refresh()
+
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill="x", pady=5)
+
+        refresh_button = ttk.Button(button_frame, text="Refresh", command=refresh, bootstyle="primary")
+        refresh_button.pack(side="left", padx=2)
+
+        snapshot_button = ttk.Button(button_frame, text="Take Snapshot", command=snapshot, bootstyle="secondary")
+        snapshot_button.pack(side="left", padx=2)
+
+        def close():
+            self.stop_memory_tracing()
+            self.diagnostics_window = None
+            diag_win.destroy()
+
+        close_button = ttk.Button(button_frame, text="Close", command=close, bootstyle="danger")
+        close_button.pack(side="right")
+
+        refresh()
+        diag_win.protocol("WM_DELETE_WINDOW", close)
+        diag_win.transient(self)
+
     def open_directory(self):
         path = filedialog.askdirectory()
         if path:
@@ -512,13 +622,26 @@ class App(ttk.Window):
             self.split_paned_window.pack(expand=True, fill="both")
 
 
+        self._evict_split_view_cache(keep=(file_path1, file_path2))
         self.current_file_path = [file_path1, file_path2] # Store both paths for split view
         self._load_content_into_frame(file_path1, self.html_frame_left)
         self._load_content_into_frame(file_path2, self.html_frame_right)
 
+    def _evict_split_view_cache(self, keep=()):
+        # Evict cached HTML for compared files that have no tab of their own
+        if isinstance(self.current_file_path, list):
+            for path in self.current_file_path:
+                if path not in self.open_files and path not in keep and path in self.html_cache:
+                    del self.html_cache[path]
+
     def show_single_view(self):
-        if hasattr(self, 'split_paned_window') and self.split_paned_window.winfo_ismapped():
-            self.split_paned_window.pack_forget()
+        if hasattr(self, 'split_paned_window'):
+            # Destroy the split view HtmlFrames so their background threads stop
+            self.html_frame_left.destroy()
+            self.html_frame_right.destroy()
+            self.split_paned_window.destroy()
+            del self.split_paned_window, self.html_frame_left, self.html_frame_right
+            self._evict_split_view_cache()
         self.notebook.pack(expand=True, fill="both")
         self.current_file_path = None # Reset for single view
 
@@ -0,0 +1,99 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("tkinterweb")
+
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from MDViewer import App
+
+# Run with --runslow; override the cycle count with MDVIEWER_SOAK_ITERATIONS
+ITERATIONS = int(os.environ.get("MDVIEWER_SOAK_ITERATIONS", "2000"))
+WARMUP_ITERATIONS = 20
+MAX_GROWTH_PER_ITERATION = 64 # bytes of positive tracemalloc growth allowed per cycle
+
+
+@pytest.fixture
+def app():
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        pytest.skip("no display available")
+    try:
+        app = App()
+    except tk.TclError as e:
+        pytest.skip(f"cannot create Tk window: {e}")
+    app.withdraw()
+    app.update()
+    yield app
+    app.stop_memory_tracing()
+    app.destroy()
+
+
+@pytest.fixture
+def md_files(tmp_path):
+    paths = []
+    for name in ("a.md", "b.md", "c.md"):
+        path = tmp_path / name
+        path.write_text(f"# {name}\n\nSome *text* with `code`.\n", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def _cycle(app, tab_file, left_file, right_file):
+    app.show_single_view()
+    app.show_file_content(tab_file)
+    app.update()
+    app.close_tab(tab_file)
+    app.update()
+    app.show_split_view(left_file, right_file)
+    app.update()
+    app.show_single_view()
+    app.update()
+
+
+def _wait_for_threads(app, expected, timeout=5.0):
+    # Give destroyed HtmlFrames a moment to wind down their background threads
+    deadline = time.monotonic() + timeout
+    while threading.active_count() != expected and time.monotonic() < deadline:
+        app.update()
+        time.sleep(0.05)
+    return threading.active_count()
+
+
+def _assert_released(app, expected_threads):
+    assert _wait_for_threads(app, expected_threads) == expected_threads
+    stats = app.get_resource_stats()
+    assert stats["html_frames"] == 0
+    assert stats["html_cache"] == 0
+    assert stats["open_files"] == 0
+    assert stats["threads"] == expected_threads
+
+
+@pytest.mark.slow
+def test_open_close_returns_to_baseline(app, md_files):
+    tab_file, left_file, right_file = md_files
+    threads_before = threading.active_count()
+
+    # Warm up interpreter and Tk caches so they don't show up as growth
+    for _ in range(WARMUP_ITERATIONS):
+        _cycle(app, tab_file, left_file, right_file)
+    _assert_released(app, threads_before)
+    app.take_memory_snapshot()
+
+    for _ in range(ITERATIONS):
+        _cycle(app, tab_file, left_file, right_file)
+    _assert_released(app, threads_before)
+
+    diff = app.compare_memory_snapshots(top_n=None)
+    assert diff is not None
+    growth = sum(stat.size_diff for stat in diff if stat.size_diff > 0)
+    assert growth < ITERATIONS * MAX_GROWTH_PER_ITERATION
+
+
+def test_compare_memory_snapshots_without_baseline(app):
+    assert app.compare_memory_snapshots() is None